@@ -8,4 +8,7 @@ app = Celery("bankStream")
 
 app.config_from_object('django.conf:settings', namespace="CELERY")
 
-app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
+# Only our own apps define tasks modules; third-party task modules that are
+# needed are listed explicitly in CELERY_IMPORTS.
+app.autodiscover_tasks(lambda: settings.LOCAL_APPS,
+                       related_name="tasks", force=False)
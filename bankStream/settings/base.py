@@ -1,10 +1,8 @@
 from pathlib import Path
 from datetime import timedelta, date
 import os
-from os import getenv, path
-from dotenv import load_dotenv
-from loguru import logger
-import cloudinary
+from os import getenv
+from kombu import Exchange, Queue
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -12,10 +10,6 @@ BASE_DIR = Path(__file__).resolve(strict=True).parent.parent.parent
 
 APPS_DIR = BASE_DIR / 'core_apps'
 
-local_env_file = path.join(BASE_DIR, '.envs', '.env.local')
-if path.isfile(local_env_file):
-    load_dotenv(local_env_file)
-
 
 # Application definition
 
@@ -26,30 +20,39 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'django.contrib.sites',
-    'django.contrib.humanize',
 ]
 
-THIRD_PARTY_APPS = [
+THIRD_PARTY_APPS_CORE = [
     'rest_framework',
     'django_filters',
+    'cloudinary',
+    'djcelery_email',
+    'django_celery_beat',
+]
+
+# Only needed by processes serving HTTP/admin traffic; celery processes set
+# DJANGO_PROCESS_ROLE to something other than "web" to skip loading them.
+THIRD_PARTY_APPS_WEB = [
     'django_countries',
     'phonenumber_field',
     'drf_spectacular',
     'djoser',
-    'cloudinary',
-    'djcelery_email',
-    'django_celery_beat',
-    'loguru',
 ]
 
+DJANGO_PROCESS_ROLE = getenv('DJANGO_PROCESS_ROLE', 'web')
+
 LOCAL_APPS = [
     'core_apps.common',
     'core_apps.user_auth',
     'core_apps.user_profile',
 ]
 
-INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
+INSTALLED_APPS = (
+    DJANGO_APPS
+    + THIRD_PARTY_APPS_CORE
+    + (THIRD_PARTY_APPS_WEB if DJANGO_PROCESS_ROLE == 'web' else [])
+    + LOCAL_APPS
+)
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
@@ -68,13 +71,22 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [str(APPS_DIR / 'templates')],
-        'APP_DIRS': True,
+        'APP_DIRS': False,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'loaders': [
+                (
+                    'django.template.loaders.cached.Loader',
+                    [
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ],
+                ),
+            ],
         },
     },
 ]
@@ -96,8 +108,18 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': getenv('REDIS_URL') or 'redis://redis:6379/1',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        },
+    }
+}
+
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "core_apps.user_auth.hashers.BoundedArgon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
     "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
@@ -135,8 +157,6 @@ USE_I18N = True
 
 USE_TZ = True
 
-SITE_ID = 1
-
 FILE_UPLOAD_PERMISSIONS = None
 
 # Static files (CSS, JavaScript, Images)
@@ -170,6 +190,9 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
     ),
     "PAGE_SIZE": 10,
+    # nginx is the only proxy in front of django; throttles key on the address
+    # it appends to X-Forwarded-For rather than on the client supplied header.
+    "NUM_PROXIES": 1,
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
         "rest_framework.throttling.UserRateThrottle",
@@ -177,6 +200,7 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_RATES": {
         "anon": "50/day",
         "user": "100/day",
+        "otp_verify": "5/min",
     }
 }
 SIMPLE_JWT = {
@@ -219,6 +243,12 @@ if USE_TZ:
     CELERY_TIMEZONE = TIME_ZONE
 
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
+# Keep enough pooled broker connections around for the worker concurrency
+CELERY_BROKER_POOL_LIMIT = int(os.getenv("CELERY_BROKER_POOL_LIMIT", "10"))
+# Compose starts the workers alongside rabbitmq without waiting for it, so
+# keep retrying the broker at boot instead of exiting.
+CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+CELERY_BROKER_HEARTBEAT = 120
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")
 CELERY_ACCEPT_CONTENT = ["application/json"]
 CELERY_TASK_SERIALIZER = "json"
@@ -231,15 +261,31 @@ CELERY_TASK_TIME_LIMIT = 5*60
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 CELERY_WORKER_SEND_TASK_EVENTS = True
+# Third-party task modules; local apps are picked up by autodiscovery
+CELERY_IMPORTS = ("djcelery_email.tasks",)
+CELERY_TASK_DEFAULT_QUEUE = "celery"
+CELERY_TASK_QUEUES = (
+    Queue("celery", Exchange("celery"), routing_key="celery"),
+    # Outgoing mail does not need to survive a broker restart; transient
+    # messages skip the broker's disk writes.
+    Queue("email", Exchange("email", delivery_mode=1),
+          routing_key="email", durable=False),
+)
+CELERY_TASK_ROUTES = {
+    "djcelery_email_send_multiple": {"queue": "email"},
+    "core_apps.user_auth.tasks.send_otp_email": {"queue": "email"},
+    "core_apps.user_auth.tasks.send_account_locked_email": {"queue": "email"},
+}
+
+# Hand emails over to celery instead of talking SMTP inside the request
+EMAIL_BACKEND = "djcelery_email.backends.CeleryEmailBackend"
+# Backend the celery workers use to actually deliver the mail
+CELERY_EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 
 CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
 CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
 CLOUDINARY_CLOUD_NAME = os.getenv("CLOUDINARY_CLOUD_NAME")
-cloudinary.config(
-    cloud_name=CLOUDINARY_CLOUD_NAME,
-    api_key=CLOUDINARY_API_KEY,
-    api_secret=CLOUDINARY_API_SECRET,
-)
+
 # Disable Django's built-in logging
 LOGGING_CONFIG = None
 
@@ -253,13 +299,20 @@ COOKIE_HTTPONLY = True
 # Cookie Secure attribute to ensure cookies are only sent over HTTPS
 COOKIE_SECURE = os.getenv("COOKIE_SECURE", "True") == "True"
 
-# Loguru logging configuration
+# Rendering variable values in tracebacks is costly and can leak data, so it
+# is only enabled while debugging.
+LOG_DIAGNOSE = os.getenv("DEBUG", "False") == "True"
+# Debug records are kept while debugging, production only writes INFO and up
+LOG_LEVEL = os.getenv("LOG_LEVEL") or ("DEBUG" if LOG_DIAGNOSE else "INFO")
+
+# Loguru logging configuration, applied in CommonConfig.ready()
 LOGURU_LOGGING = {
     'handlers': [
         {
             'sink': BASE_DIR / 'logs/debug.log',
-            'level': 'DEBUG',
-            'filter': lambda record: record["level"].no <= logger.level("WARNING").no,
+            'level': LOG_LEVEL,
+            # 30 is loguru's WARNING severity
+            'filter': lambda record: record["level"].no <= 30,
             'format': '{time:YYYY-MM-DD HH:mm:ss.SSS} | {level:<8} | {name}:{function}:{line} - {message}',
             'rotation': '10MB',
             'retention': '30 days',
@@ -272,12 +325,11 @@ LOGURU_LOGGING = {
             'rotation': '10MB',
             'retention': '30 days',
             'compression': 'zip',
-            'backtrace': True,
-            'diagnose': True,
+            'backtrace': False,
+            'diagnose': LOG_DIAGNOSE,
         },
     ],
 }
-logger.configure(**LOGURU_LOGGING)
 
 LOGGING = {
     'version': 1,
@@ -1,11 +1,76 @@
+import os
+import pickle
 from os import getenv, path
-from dotenv import load_dotenv
-from .base import *  # noqa
-from .base import BASE_DIR
+from pathlib import Path
+
+
+def _parse_env(env_file):
+    """
+    Parse KEY=VALUE pairs from an env file into a dict.
+
+    Blank lines and comments are skipped and surrounding quotes are stripped.
+    """
+    values = {}
+    with open(env_file, 'rb') as f:
+        content = f.read().decode()
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        key = key.strip()
+        if key.startswith('export '):
+            key = key[len('export '):].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+def _load_env(env_file):
+    """
+    Load an env file into os.environ without overriding existing variables.
 
-local_env_file = path.join(BASE_DIR, '.envs', '.env.local')
+    The parsed values are pickled next to the env file and reused for as long
+    as the cache is at least as new as the source, much like __pycache__.
+    """
+    cache_file = env_file + '.pkl'
+    values = None
+    try:
+        if path.getmtime(cache_file) >= path.getmtime(env_file):
+            with open(cache_file, 'rb') as f:
+                values = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        values = None
+
+    if values is None:
+        values = _parse_env(env_file)
+        # Written to a private temp file and swapped in, so a process starting
+        # alongside never reads a half-written cache.
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(values, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+# Loaded before importing base so that its getenv() calls see these values.
+local_env_file = path.join(
+    Path(__file__).resolve(strict=True).parent.parent.parent, '.envs', '.env.local')
 if path.isfile(local_env_file):
-    load_dotenv(local_env_file)
+    _load_env(local_env_file)
+
+from .base import *  # noqa
 
 SECRET_KEY = getenv('SECRET_KEY')
 
@@ -18,7 +83,6 @@ ALLOWED_HOSTS = ["localhost", "127.0.0.1", '0.0.0.0']
 
 ADMIN_URL = getenv('ADMIN_URL')
 
-EMAIL_BACKEND = 'djcelery_email.backends.CeleryEmailBackend'
 EMAIL_HOST = getenv('EMAIL_HOST')
 EMAIL_PORT = getenv('EMAIL_PORT')
 DEFAULT_FROM_EMAIL = getenv('DEFAULT_FROM_EMAIL')
@@ -6,3 +6,15 @@ class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core_apps.common"
     verbose_name = _("Common")
+
+    def ready(self) -> None:
+        import cloudinary
+        from django.conf import settings
+        from loguru import logger
+
+        logger.configure(**settings.LOGURU_LOGGING)
+        cloudinary.config(
+            cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+            api_key=settings.CLOUDINARY_API_KEY,
+            api_secret=settings.CLOUDINARY_API_SECRET,
+        )
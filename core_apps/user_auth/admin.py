@@ -4,6 +4,56 @@ from django.utils.translation import gettext_lazy as _
 from .models import User
 from .forms import UserChangeForm, UserCreationForm
 
+_USER_FIELDSETS = (
+    (
+        _("Login Credentials"),
+        {
+            "fields": (
+                "username",
+                "email",
+                "password",
+            )
+        },
+    ),
+    (
+        _("Personal Information"),
+        {"fields": ("first_name", "middle_name",
+                    "last_name", "id_no", "role")},
+    ),
+    (
+        _("Account Status"),
+        {
+            "fields": (
+                "account_status",
+                "failed_login_attempts",
+                "last_failed_login",)
+        },
+    ),
+    (
+        _("Security"),
+        {
+            "fields": ("security_question", "security_answer",)
+        },
+    ),
+    (
+        _("Permissions and Groups"),
+        {
+            "fields": (
+                "is_active",
+                "is_staff",
+                "is_superuser",
+                "groups",
+                "user_permissions",)
+        },
+    ),
+    (
+        _("Important dates"),
+        {
+            "fields": ("last_login", "date_joined",)
+        },
+    ),
+)
+
 
 @admin.register(User)
 class CustomUserAdmin(UserAdmin):
@@ -15,74 +65,31 @@ class CustomUserAdmin(UserAdmin):
         form (UserChangeForm): Form used for changing existing users.
         add_form (UserCreationForm): Form used for creating new users.
         model (User): The user model managed by this admin.
-        list_display (list): Fields displayed in the user list view.
-        list_filter (list): Fields available for filtering the user list.
+        list_display (tuple): Fields displayed in the user list view.
+        list_filter (tuple): Fields available for filtering the user list.
         fieldsets (tuple): Grouped fields for organizing the user edit form.
-        search_fields (list): Fields searchable in the admin interface.
+        search_fields (tuple): Fields searchable in the admin interface.
         ordering (list): Default ordering of users in the list view.
     """
     form = UserChangeForm
     add_form = UserCreationForm
     model = User
-    list_display = [
+    list_display = (
         "email",
         "username",
         "first_name",
         "last_name",
         "is_staff",
         "is_active",
-        "role"
-    ]
-    list_filter = ["email", "is_staff", "is_active", "role"]
-    fieldsets = (
-        (
-            _("Login Credentials"),
-            {
-                "fields": (
-                    "username",
-                    "email",
-                    "password",
-                )
-            },
-        ),
-        (
-            _("Personal Information"),
-            {"fields": ("first_name", "middle_name",
-                        "last_name", "id_no", "role")},
-        ),
-        (
-            _("Account Status"),
-            {
-                "fields": (
-                    "account_status",
-                    "failed_login_attempts",
-                    "last_failed_login",)
-            },
-        ),
-        (
-            _("Security"),
-            {
-                "fields": ("security_question", "security_answer",)
-            },
-        ),
-        (
-            _("Permissions and Groups"),
-            {
-                "fields": (
-                    "is_active",
-                    "is_staff",
-                    "is_superuser",
-                    "groups",
-                    "user_permissions",)
-            },
-        ),
-        (
-            _("Important dates"),
-            {
-                "fields": ("last_login", "date_joined",)
-            },
-        ),
-
+        "role",
     )
-    search_fields = ["email", "username", "first_name", "last_name"]
+    list_filter = ("email", "is_staff", "is_active", "role")
+    fieldsets = _USER_FIELDSETS
+    search_fields = ("email", "username", "first_name", "last_name")
     ordering = ["email"]
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Locking or unlocking from the admin only takes effect through the cache.
+        if "account_status" in form.changed_data:
+            obj.sync_lockout()
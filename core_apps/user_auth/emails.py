@@ -1,17 +1,28 @@
+from functools import cache
+
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from django.template.loader import get_template
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
 
 
-def send_otp_email(email, otp):
+@cache
+def _get_template(template_name):
+    """
+    Returns the compiled template for `template_name`, looking it up only once
+    per process.
+    """
+    return get_template(template_name)
+
+
+def send_otp_email(email, otp, connection=None):
     """
     Sends a One-Time Password (OTP) email to the specified recipient.
     Args:
         email (str): The recipient's email address.
         otp (str): The OTP code to be sent.
+        connection: Optional email backend connection; defaults to EMAIL_BACKEND.
     Description:
         This function renders an HTML email template with the provided OTP and site information,
         sends the email to the recipient, and logs the result. If sending fails, an error is logged.
@@ -26,21 +37,21 @@ def send_otp_email(email, otp):
         "expiry_time": settings.OTP_EXPIRATION,
         "site_name": settings.SITE_NAME
     }
-    html_email = render_to_string("emails/otp_email.html", context)
-    plain_email = strip_tags(html_email)
-    email = EmailMultiAlternatives(
-        subject, plain_email, from_email, recepient_list)
-    email.attach_alternative(html_email, "text/html")
+    html_email = _get_template("emails/otp_email.html").render(context)
+    plain_email = _get_template("emails/otp_email.txt").render(context)
+    msg = EmailMultiAlternatives(
+        subject, plain_email, from_email, recepient_list, connection=connection)
+    msg.attach_alternative(html_email, "text/html")
 
     try:
-        email.send()
-        logger.info(f"OTP email sent successfully to: {email}")
+        msg.send()
+        logger.info(f"OTP email sent successfully to: {recepient_list[0]}")
 
     except Exception as e:
         logger.error(f"Failed to send OTP to {email}: Error: {str(e)}")
 
 
-def send_account_locked_email(self):
+def send_account_locked_email(self, connection=None):
     """
     Sends an email notification to the user when their account has been locked due
       to security reasons.
@@ -53,6 +64,7 @@ def send_account_locked_email(self):
         user (object): The user whose account is locked.
         lockout_duration (int): Duration of the lockout in minutes.
         site_name (str): Name of the site.
+        connection: Optional email backend connection; defaults to EMAIL_BACKEND.
     """
     subject = _("Youraccount has been locked")
     from_email = settings.DEFAULT_FROM_EMAIL
@@ -62,15 +74,15 @@ def send_account_locked_email(self):
         "lockout_duration": int(settings.LOCKOUT_DURATION.total_seconds() // 60),
         "site_name": settings.SITE_NAME
     }
-    html_email = render_to_string("emails/account_locked.html", context)
-    plain_email = strip_tags(html_email)
-    email = EmailMultiAlternatives(
-        subject, plain_email, from_email, recepient_list)
-    email.attach_alternative(html_email, "text/html")
+    html_email = _get_template("emails/account_locked.html").render(context)
+    plain_email = _get_template("emails/account_locked.txt").render(context)
+    msg = EmailMultiAlternatives(
+        subject, plain_email, from_email, recepient_list, connection=connection)
+    msg.attach_alternative(html_email, "text/html")
 
     try:
-        email.send()
-        logger.info(f"Account locked email sent to: {email}")
+        msg.send()
+        logger.info(f"Account locked email sent to: {recepient_list[0]}")
 
     except Exception as e:
         logger.error(
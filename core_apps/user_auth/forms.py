@@ -1,12 +1,67 @@
 from django.contrib.auth.forms import UserChangeForm as DjangoUserChangeForm
 from django.contrib.auth.forms import UserCreationForm as DjangoUserCreationForm
 from django.core.exceptions import ValidationError
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from .models import User
 
+_USER_FORM_FIELDS = (
+    "email",
+    "id_no",
+    "first_name",
+    "middle_name",
+    "last_name",
+    "security_question",
+    "security_answer",
+    "is_staff",
+    "is_superuser",
+)
 
-class UserCreationForm(DjangoUserCreationForm):
+
+class UniqueIdentityMixin:
+    """
+    Validates that email and id_no are not taken by another user.
+
+    Both fields are checked with a single query from clean(), instead of one
+    query per field. Django's per-field unique checks for them are skipped in
+    validate_unique() since they would repeat the same lookups; the unique
+    constraints on the table still guard against concurrent inserts.
+    """
+
+    def validate_unique_identity(self, cleaned_data):
+        email = cleaned_data.get("email")
+        id_no = cleaned_data.get("id_no")
+
+        lookup = Q()
+        if email:
+            lookup |= Q(email=email)
+        if id_no is not None:
+            lookup |= Q(id_no=id_no)
+        if not lookup:
+            return
+
+        hits = set(
+            User.objects.filter(lookup)
+            .exclude(pk=self.instance.pk)
+            .values_list("email", "id_no")
+        )
+        if email and any(hit_email == email for hit_email, _id_no in hits):
+            self.add_error("email", _("A user with that email already exists."))
+        if id_no is not None and any(hit_id_no == id_no for _email, hit_id_no in hits):
+            self.add_error("id_no", _(
+                "A user with that ID number already exists."))
+
+    def validate_unique(self):
+        exclude = self._get_validation_exclusions()
+        exclude.update({"email", "id_no"})
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except ValidationError as e:
+            self._update_errors(e)
+
+
+class UserCreationForm(UniqueIdentityMixin, DjangoUserCreationForm):
     """
     A custom user creation form extending Django's UserCreationForm.
     This form is used to create new User instances with additional fields and validation logic:
@@ -24,58 +79,17 @@ class UserCreationForm(DjangoUserCreationForm):
         - is_staff: Boolean indicating staff status.
         - is_superuser: Boolean indicating superuser status.
     Methods:
-        - clean_email: Validates uniqueness of email.
-        - clean_id_no: Validates uniqueness of id_no.
-        - clean: Validates presence of security question and answer for regular users.
+        - clean: Validates uniqueness of email and id_no, and presence of security
+          question and answer for regular users.
         - save: Saves the user instance to the database.
     """
     class Meta:
         model = User
-        fields = [
-            "email",
-            "id_no",
-            "first_name",
-            "middle_name",
-            "last_name",
-            "security_question",
-            "security_answer",
-            "is_staff",
-            "is_superuser"
-        ]
-
-    def clean_email(self):
-        """
-        Validates the email field to ensure uniqueness.
-
-        Checks if a user with the provided email already exists in the database.
-        Raises a ValidationError if the email is already taken.
-
-        Returns:
-            str: The validated email address.
-
-        Raises:
-            ValidationError: If a user with the given email already exists.
-        """
-        email = self.cleaned_data.get("email")
-        if User.objects.filter(email=email).exists():
-            raise ValidationError(_("A user with that email already exist"))
-        return email
-
-    def clean_id_no(self):
-        """
-        Validates the 'id_no' field to ensure uniqueness.
-
-        Checks if a user with the provided 'id_no' already exists in the database.
-        Raises a ValidationError if a duplicate is found.
-        Returns the validated 'id_no' if it is unique.
-        """
-        id_no = self.cleaned_data.get("id_no")
-        if User.objects.filter(id_no=id_no).exists():
-            raise ValidationError(_("A user with that id_no already exist"))
-        return id_no
+        fields = _USER_FORM_FIELDS
 
     def clean(self):
         cleaned_data = super().clean()
+        self.validate_unique_identity(cleaned_data)
         is_superuser = cleaned_data.get("is_superuser")
         security_question = cleaned_data.get("security_question")
         security_answer = cleaned_data.get("security_answer")
@@ -96,77 +110,28 @@ class UserCreationForm(DjangoUserCreationForm):
         return user
 
 
-class UserChangeForm(DjangoUserChangeForm):
+class UserChangeForm(UniqueIdentityMixin, DjangoUserChangeForm):
     """
     A form for updating user information, extending Django's UserChangeForm.
     This form allows modification of user fields such as email, ID number, names, security question/answer, and user status flags.
     It enforces uniqueness for email and ID number, and requires security question and answer for non-superuser accounts.
     Attributes:
         Meta:
-            models (User): The user model to use for the form.
-            fields (list): List of fields to include in the form.
+            model (User): The user model to use for the form.
+            fields (tuple): Fields to include in the form.
     Methods:
-        clean_email():
-            Validates that the email is unique among all users except the current instance.
-        clean_id_no():
-            Validates that the ID number is unique among all users except the current instance.
         clean():
-            Ensures that security question and answer are provided for regular users (non-superusers).
+            Validates that the email and ID number are unique among all users except the
+            current instance, and ensures that security question and answer are provided
+            for regular users (non-superusers).
     """
     class Meta:
-        models = User
-        fields = [
-            "email",
-            "id_no",
-            "first_name",
-            "middle_name",
-            "last_name",
-            "security_question",
-            "security_answer",
-            "is_active",
-            "is_staff",
-            "is_superuser"
-        ]
-
-    def clean_email(self):
-        """
-        Validates the email field to ensure uniqueness among users.
-
-        Checks if any other user (excluding the current instance) already has the provided email.
-        Raises a ValidationError if a duplicate email is found.
-
-        Returns:
-            str: The validated email address.
-
-        Raises:
-            ValidationError: If a user with the given email already exists.
-        """
-        email = self.cleaned_data.get("email")
-        if User.objects.exclude(pk=self.instance.pk).filter(email=email).exists():
-            raise ValidationError(_("A user with that email already exists."))
-        return email
-
-    def clean_id_no(self):
-        """
-        Validates the uniqueness of the 'id_no' field for the user.
-
-        Checks if another user (excluding the current instance) already exists with the same ID number.
-        Raises a ValidationError if a duplicate is found.
-
-        Returns:
-            str: The validated ID number.
-
-        Raises:
-            ValidationError: If a user with the given ID number already exists.
-        """
-        id_no = self.cleaned_data.get("id_no")
-        if User.objects.exclude(pk=self.instance.pk).filter(id_no=id_no).exists():
-            raise ValidationError(
-                _("A user with that ID number already exists."))
-        return id_no
+        model = User
+        fields = _USER_FORM_FIELDS + ("is_active",)
 
     def clean(self):
         cleaned_data = super().clean()
+        self.validate_unique_identity(cleaned_data)
         is_superuser = cleaned_data.get("is_superuser")
         security_question = cleaned_data.get("security_question")
         security_answer = cleaned_data.get("security_answer")
@@ -0,0 +1,15 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class BoundedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 password hasher with bounded cost parameters.
+
+    Django's defaults (100 MiB of memory, 8 lanes) make every login verification
+    expensive. These values follow the OWASP minimum recommendation for argon2id
+    (19 MiB, 2 iterations, 1 lane). The algorithm name is unchanged, so existing
+    hashes still verify and are upgraded to these parameters on the next login.
+    """
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
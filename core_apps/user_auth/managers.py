@@ -1,6 +1,4 @@
-import random
-import string
-from os import getenv
+from os import getenv, urandom
 from typing import Any, Optional
 
 from django.contrib.auth.hashers import make_password
@@ -9,6 +7,19 @@ from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
 from django.utils.translation import gettext_lazy as _
 
+# The bank name does not change while the process runs, so the username
+# prefix and the length of the random part are computed once at import time.
+_BANK_PREFIX = "".join(
+    word[0].upper()
+    for word in getenv("BANK_NAME", "").replace(
+        ".", " ").replace("-", " ").replace("_", " ").split()
+)
+_RANDOM_LEN = 12 - len(_BANK_PREFIX) - 1
+# 32 symbols, so mapping each random byte through its low 5 bits picks one
+# without bias; the table lets bytes.translate() do the mapping in C.
+_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_BYTE_TO_CHAR = bytes(_ALPHABET[i & 31] for i in range(256))
+
 
 def generate_username() -> str:
     """
@@ -17,20 +28,13 @@ def generate_username() -> str:
     The username is constructed by taking the first letter of each word in
       the bank name (converted to uppercase),
     followed by a hyphen and a random sequence of uppercase letters and
-      digits to reach a total length of 12 characters.
+      the digits 2-7 to reach a total length of 12 characters.
 
     Returns:
         str: The generated username.
     """
-    bank_name = getenv("BANK_NAME").replace(
-        ".", " ").replace("-", " ").replace("_", " ").strip()
-    words = bank_name.split()
-    prefix = "".join(word[0].upper() for word in words if word)
-    remaining_length = 12 - len(prefix) - 1
-    random_chars = "".join(random.choices(
-        string.ascii_uppercase + string.digits, k=remaining_length))
-    username = f"{prefix}-{random_chars}"
-    return username
+    random_chars = urandom(_RANDOM_LEN).translate(_BYTE_TO_CHAR).decode()
+    return f"{_BANK_PREFIX}-{random_chars}"
 
 
 def validate_email_address(email: str) -> None:
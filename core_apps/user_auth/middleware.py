@@ -1,19 +1,29 @@
+from django.utils.functional import SimpleLazyObject, empty
+
+
 class CustomHeaderMiddleware:
     """
     Middleware that adds a custom HTTP header 'X-Django-User' to responses for authenticated users.
-    If the user is authenticated, the middleware sets the 'X-Django-User' header to the user's email address.
+    If the user is authenticated, the middleware sets the 'X-Django-User' header to the user's username.
+    A user installed by DRF authentication or already resolved by AuthenticationMiddleware is used
+    as is; a lazy session user that was never evaluated is skipped, so the header never forces an
+    extra user lookup on requests that did not need one.
     This can be useful for debugging, logging, or passing user information to frontend applications.
     Args:
         get_response (callable): The next middleware or view in the Django request/response cycle.
     Methods:
         __call__(request): Processes the incoming request and adds the custom header to the response if the user is authenticated.
     """
+    __slots__ = ("get_response",)
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         response = self.get_response(request)
-        if request.user.is_authenticated:
-            response["X-Django-User"] = request.user.username
+        user = request.__dict__.get("user")
+        if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+            return response
+        if user is not None and user.is_authenticated:
+            response["X-Django-User"] = user.username
         return response
@@ -1,12 +1,31 @@
 import uuid
+from functools import cached_property
+from typing import Any
 from django.db import models
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from .emails import send_account_locked_email
 from .managers import UserManager
+from .tasks import queue_email, send_account_locked_email
+
+
+def _lock_key(user_id) -> str:
+    return f"lock:{user_id}"
+
+
+def _failed_logins_key(user_id) -> str:
+    return f"failed:{user_id}"
+
+
+def otp_cache_key(otp: str) -> str:
+    return f"otp:{otp}"
+
+
+def _otp_user_key(user_id) -> str:
+    return f"otp_user:{user_id}"
 
 
 class User(AbstractUser):
@@ -36,12 +55,13 @@ class User(AbstractUser):
         AccountStatus: Enum for account status (ACTIVE, LOCKED).
         RoleChoices: Enum for user roles (CUSTOMER, ACCOUNT_EXECUTIVE, TELLER, BRANCH_MANAGER).
     Methods:
-        set_otp(otp: str): Sets OTP and expiry time.
-        verify_otp(otp: str) -> bool: Verifies OTP and resets if valid.
+        set_otp(otp: str) -> bool: Issues an OTP for the user until it expires.
+        verify_otp(otp: str) -> bool: Verifies OTP and consumes it if valid.
         handle_failed_login_attempts(): Increments failed login attempts, locks
           account if threshold exceeded.
         reset_failed_login_attempts(): Resets failed login attempts and unlocks account.
         unlock_account(): Unlocks account if currently locked.
+        sync_lockout(): Applies an `account_status` edited directly to the lockout cache.
         has_role(role_name: str) -> bool: Checks if user has a specific role.
         __str__() -> str: Returns string representation of the user.
     Properties:
@@ -133,27 +153,39 @@ class User(AbstractUser):
     REQUIRED_FIELDS = [
         "first_name", "last_name", "id_no", "security_question", "security_answer"]
 
-    def set_otp(self, otp: str) -> None:
+    def set_otp(self, otp: str) -> bool:
         """
-        Sets the OTP (One-Time Password) for the user and updates its expiry time.
+        Sets the OTP (One-Time Password) for the user until OTP_EXPIRATION.
+
+        The OTP is stored in the cache keyed by its value and mapped to the user's id,
+          so verifying it is a single lookup and expired codes disappear on their own.
+          The user's current code is tracked as well, so issuing a new OTP invalidates
+          the previous one.
 
         Args:
             otp (str): The OTP value to be set.
 
-        Side Effects:
-            - Updates the `otp` and `otp_expiry_time` fields of the user instance.
-            - Saves the changes to the database.
+        Returns:
+            bool: True if the OTP was set, False if the same code is currently issued
+              to another login, in which case the caller should generate a new one.
         """
-        self.otp = otp
-        self.otp_expiry_time = timezone.now() + settings.OTP_EXPIRATION
-        self.save()
+        timeout = int(settings.OTP_EXPIRATION.total_seconds())
+        user_key = _otp_user_key(self.pk)
+        previous = cache.get(user_key)
+        # The old code may have expired and been reissued to someone else.
+        if previous is not None and cache.get(otp_cache_key(previous)) == str(self.pk):
+            cache.delete(otp_cache_key(previous))
+        if not cache.add(otp_cache_key(otp), str(self.pk), timeout=timeout):
+            return False
+        cache.set(user_key, otp, timeout=timeout)
+        return True
 
     def verify_otp(self, otp: str) -> bool:
         """
-        Verifies the provided OTP against the stored OTP and checks if it is still valid.
+        Verifies the provided OTP against the OTP issued to the user.
 
-        If the OTP matches and has not expired, clears the OTP and its expiry time,
-          saves the changes, and returns True. Otherwise, returns False.
+        If the OTP was issued to this user and has not expired, removes it so that it
+          cannot be used again, and returns True. Otherwise, returns False.
 
         Args:
             otp (str): The OTP code to verify.
@@ -161,10 +193,11 @@ class User(AbstractUser):
         Returns:
             bool: True if the OTP is correct and valid, False otherwise.
         """
-        if self.otp == otp and self.otp_expiry_time > timezone.now():
-            self.otp = ""
-            self.otp_expiry_time = None
-            self.save()
+        key = otp_cache_key(otp)
+        # delete() reports whether the key still existed, so when two requests
+        # present the same code only one of them gets to consume it.
+        if cache.get(key) == str(self.pk) and cache.delete(key):
+            cache.delete(_otp_user_key(self.pk))
             return True
         return False
 
@@ -175,72 +208,109 @@ class User(AbstractUser):
         If the number of failed attempts reaches the configured threshold, locks
           the user's account and sends a notification email.
 
+        The counter is an atomic cache increment on a key that expires
+          LOCKOUT_DURATION after the first failure, so concurrent failures are
+          never lost and the user row is only written once, when the account locks.
+          No row lock is taken, so a burst of failures cannot queue up on the user row.
+
         Side Effects:
-            - Updates `failed_login_attempts` and `last_failed_login` fields.
-            - May update `account_status` to locked.
-            - Persists changes to the database.
-            - Sends an account locked email if threshold is reached.
+            - Updates `failed_login_attempts` and `last_failed_login` on the instance.
+            - May update `account_status` to locked and set the lockout key in the cache.
+            - Persists changes to the database when the account is locked.
+            - Queues an account locked email if threshold is reached.
         """
-        self.failed_login_attempts += 1
+        key = _failed_logins_key(self.pk)
+        lockout_seconds = int(settings.LOCKOUT_DURATION.total_seconds())
+        cache.add(key, 0, timeout=lockout_seconds)
+        try:
+            self.failed_login_attempts = cache.incr(key)
+        except ValueError:
+            # The key expired between add() and incr(); start a new window.
+            cache.set(key, 1, timeout=lockout_seconds)
+            self.failed_login_attempts = 1
         self.last_failed_login = timezone.now()
-        if self.failed_login_attempts >= settings.LOGIN_ATTEMPTS:
+        # Only the request whose increment reaches the threshold locks the account,
+        # so concurrent failures never race on the user row or send duplicate emails.
+        if self.failed_login_attempts == settings.LOGIN_ATTEMPTS:
             self.account_status = self.AccountStatus.LOCKED
-            self.save()
-            send_account_locked_email(self)
-        self.save()
+            cache.set(_lock_key(self.pk), 1, timeout=lockout_seconds)
+            # A single UPDATE with the values derived from the atomic counter,
+            # rather than writing back the instance loaded earlier.
+            User.objects.filter(pk=self.pk).update(
+                failed_login_attempts=self.failed_login_attempts,
+                last_failed_login=self.last_failed_login,
+                account_status=self.account_status,
+            )
+            queue_email(send_account_locked_email, str(self.pk))
 
     def reset_failed_login_attempts(self) -> None:
         """
         Resets the user's failed login attempts and related account status.
 
         Sets the failed_login_attempts counter to zero, clears the last_failed_login timestamp,
-        and updates the account_status to ACTIVE. Saves the changes to the database.
+        clears the failed login counter in the cache and updates the account_status to ACTIVE.
+        Saves the changes to the database.
         """
+        cache.delete(_failed_logins_key(self.pk))
         self.failed_login_attempts = 0
         self.last_failed_login = None
         self.account_status = self.AccountStatus.ACTIVE
-        self.save()
+        self.save(update_fields=[
+            "failed_login_attempts", "last_failed_login", "account_status"])
 
     def unlock_account(self) -> None:
         """
         Unlocks the user account if it is currently locked.
 
         This method sets the account status to ACTIVE, resets the failed login attempts counter,
-        clears the last failed login timestamp, and saves the changes to the database.
+        clears the last failed login timestamp, removes the lockout and failed login keys
+        from the cache and saves the changes to the database.
         """
         if self.account_status == self.AccountStatus.LOCKED:
+            cache.delete_many([_lock_key(self.pk), _failed_logins_key(self.pk)])
             self.account_status = self.AccountStatus.ACTIVE
             self.failed_login_attempts = 0
             self.last_failed_login = None
-            self.save()
+            self.save(update_fields=[
+                "failed_login_attempts", "last_failed_login", "account_status"])
+
+    def sync_lockout(self) -> None:
+        """
+        Applies the current `account_status` to the lockout kept in the cache.
+
+        Used when `account_status` is changed directly, e.g. from the admin: LOCKED starts
+        a lockout of LOCKOUT_DURATION and ACTIVE lifts any lockout in progress.
+        """
+        if self.account_status == self.AccountStatus.LOCKED:
+            cache.set(_lock_key(self.pk), 1,
+                      timeout=int(settings.LOCKOUT_DURATION.total_seconds()))
+        else:
+            cache.delete_many([_lock_key(self.pk), _failed_logins_key(self.pk)])
 
     @property
     def is_locked_out(self) -> bool:
         """
         Determines whether the user's account is currently locked out.
 
+        The lockout lives in the cache under a key that expires after LOCKOUT_DURATION, so
+        checking it is a single cache lookup. `account_status` mirrors the lockout in the
+        database; once the key has expired a still LOCKED account is unlocked here.
+
         Returns:
-            bool: True if the account is locked, False otherwise. If the lockout duration has passed,
-            the account is automatically unlocked and returns False.
-
-        Logic:
-            - Checks if the account status is LOCKED.
-            - If locked, verifies if the lockout duration has expired since the last failed login.
-            - Unlocks the account if the duration has passed.
-            - Returns True if still locked, otherwise False.
+            bool: True if the account is locked, False otherwise.
         """
-        if self.account_status == self.AccountStatus.LOCKED:
-            if self.last_failed_login and (timezone.now() - self.last_failed_login) > settings.LOCKOUT_DURATION:
-                self.unlock_account()
-                return False
+        if cache.get(_lock_key(self.pk)) is not None:
             return True
+        if self.account_status == self.AccountStatus.LOCKED:
+            self.unlock_account()
         return False
 
-    @property
+    @cached_property
     def full_name(self):
         """
         Returns the user's full name by concatenating the first and last names,
         formatting the result in title case and removing any leading or trailing whitespace.
+        The value is cached on the instance and cleared whenever the user is saved.
 
         Returns:
             str: The formatted full name of the user.
@@ -248,6 +318,10 @@ class User(AbstractUser):
         full_name = f"{self.first_name} {self.last_name}"
         return full_name.title().strip()
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.__dict__.pop("full_name", None)
+        super().save(*args, **kwargs)
+
     class Meta:
         """
         Meta options for the User model:
@@ -269,7 +343,7 @@ class User(AbstractUser):
         Returns:
             bool: True if the user has the specified role, False otherwise.
         """
-        return hasattr(self, "role") and self.role == role_name
+        return self.role == role_name
 
     def __str__(self) -> str:
         return f"{self.full_name} - {self.get_role_display()}"
@@ -0,0 +1,44 @@
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import get_connection
+from loguru import logger
+
+from . import emails
+
+
+def queue_email(task, *args) -> None:
+    """
+    Queues an email task without letting a broker failure fail the calling request.
+    """
+    try:
+        task.delay(*args)
+    except Exception as e:
+        logger.error(f"Failed to queue {task.name}: Error: {str(e)}")
+
+
+@shared_task
+def send_otp_email(email: str, otp: str) -> None:
+    """
+    Sends the login OTP email from a celery worker, keeping SMTP off the request path.
+
+    The worker talks to CELERY_EMAIL_BACKEND directly; going through EMAIL_BACKEND
+    would queue the message a second time.
+    """
+    emails.send_otp_email(
+        email, otp, connection=get_connection(settings.CELERY_EMAIL_BACKEND))
+
+
+@shared_task
+def send_account_locked_email(user_id: str) -> None:
+    """
+    Sends the account locked email from a celery worker.
+
+    The user is passed by primary key and loaded here, so no model state has to be
+    serialized into the task message.
+    """
+    user = get_user_model().objects.filter(pk=user_id).first()
+    if user is None:
+        return
+    emails.send_account_locked_email(
+        user, connection=get_connection(settings.CELERY_EMAIL_BACKEND))
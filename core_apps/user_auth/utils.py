@@ -1,12 +1,10 @@
 # secure_otp.py
 import secrets
-import string
 
 
 def generate_otp(length: int = 6) -> str:
     """
     Generate a cryptographically secure numeric OTP of exact length (leading zeros allowed).
-    Uses secrets.choice for cryptographic randomness.
+    Draws a single number below 10**length with secrets.randbelow and zero-pads it.
     """
-    digits = string.digits
-    return "".join(secrets.choice(digits) for _ in range(length))
+    return f"{secrets.randbelow(10 ** length):0{length}d}"
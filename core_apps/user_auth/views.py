@@ -1,48 +1,48 @@
 from typing import Any, Optional
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.utils import timezone
+from django.core.cache import cache
 from djoser.views import TokenCreateView
-from djoser.views import User
 from loguru import logger
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.request import Request
+from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
 
-from .emails import send_otp_email
+from .models import otp_cache_key
+from .tasks import queue_email, send_otp_email
 from .utils import generate_otp
 
 
 User = get_user_model()
 
+# Settings do not change at runtime, so derived durations are computed once.
+ACCESS_TTL_S = settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].total_seconds()
+REFRESH_TTL_S = settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds()
+LOCKOUT_MIN = settings.LOCKOUT_DURATION.total_seconds() / 60
+
+ACCESS_COOKIE_KW = {
+    "path": settings.COOKIE_PATH,
+    "secure": settings.COOKIE_SECURE,
+    "httponly": settings.COOKIE_HTTPONLY,
+    "samesite": settings.COOKIE_SAMESITE,
+    "max_age": ACCESS_TTL_S,
+}
+REFRESH_COOKIE_KW = {**ACCESS_COOKIE_KW, "max_age": REFRESH_TTL_S}
+# Readable by the frontend, so it can tell whether the user is logged in
+LOGGEDIN_COOKIE_KW = {**ACCESS_COOKIE_KW, "httponly": False}
+
 
 def set_auth_cookies(response: Response, access_token: str, refresh_token: Optional[str] = None) -> None:
-    access_token_lifetime = settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].total_seconds(
-    )
-    cookie_settings = {
-        "path": settings.COOKIE_PATH,
-        "secure": settings.COOKIE_SECURE,
-        "httponly": settings.COOKIE_HTTPONLY,
-        "samesite": settings.COOKIE_SAMESITE,
-        "max_age": access_token_lifetime,
-    }
-    response.set_cookie("access", access_token, **cookie_settings)
+    response.set_cookie("access", access_token, **ACCESS_COOKIE_KW)
 
     if refresh_token:
-        refresh_token_lifetime = settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds(
-        )
-        refresh_cookie_settings = cookie_settings.copy()
-        refresh_cookie_settings["max_age"] = refresh_token_lifetime
-        response.set_cookie("refresh", refresh_token,
-                            **refresh_cookie_settings)
+        response.set_cookie("refresh", refresh_token, **REFRESH_COOKIE_KW)
 
-    logged_in_cookie_settings = cookie_settings.copy()
-    logged_in_cookie_settings["httponly"] = False
-    response.set_cookie("logged_in", "true",
-                        **logged_in_cookie_settings)
+    response.set_cookie("logged_in", "true", **LOGGEDIN_COOKIE_KW)
 
 
 class CustomTokenCreateView(TokenCreateView):
@@ -54,19 +54,20 @@ class CustomTokenCreateView(TokenCreateView):
         user = serializer.user
         if user.is_locked_out:
             logger.warning(
-                f"Locked out user {user.email} attempted to log in.")
+                "Locked out user {} attempted to log in.", user.email)
             return Response(
                 {"error": f"Account is locked due to multiple failed login attempts."
-                 f"Please try again after {settings.LOCKOUT_DURATION.total_seconds() / 60} minutes."},
+                 f"Please try again after {LOCKOUT_MIN} minutes."},
                 status=status.HTTP_403_FORBIDDEN,
             )
         user.reset_failed_login_attempts()
 
         otp = generate_otp()
-        user.set_otp(otp)
-        send_otp_email(user.email, otp)
+        while not user.set_otp(otp):
+            otp = generate_otp()
+        queue_email(send_otp_email, user.email, otp)
 
-        logger.info(f"OTP sent to user {user.email} for login verification.")
+        logger.info("OTP sent to user {} for login verification.", user.email)
         return Response(
             {
                 "success": "OTP sent to your email. Please verify to complete login.",
@@ -81,23 +82,25 @@ class CustomTokenCreateView(TokenCreateView):
         try:
             serializer.is_valid(raise_exception=True)
         except Exception:
-            user = User.objects.filter(email=email).first()
+            # djoser's serializer has already looked the user up by email while
+            # validating, so reuse it rather than querying again.
+            user = serializer.user
             if user:
                 user.handle_failed_login_attempts()
                 failed_attempts = user.failed_login_attempts
 
                 logger.error(
-                    f"Failed login attempts:{failed_attempts} for user:{email}")
+                    "Failed login attempts:{} for user:{}", failed_attempts, email)
 
                 if failed_attempts >= settings.LOGIN_ATTEMPTS:
                     logger.warning(
-                        f"User {email} has been locked out due to multiple failed login attempts.")
+                        "User {} has been locked out due to multiple failed login attempts.", email)
                     return Response(
                         {
                             "error": "You have exceeded the maximum number of login attempts.",
                             "details": (
                                 f"Your account has been locked for "
-                                f"{settings.LOCKOUT_DURATION.total_seconds() / 60:.0f} minutes."
+                                f"{LOCKOUT_MIN:.0f} minutes."
                             ),
                             "further_instructions": (
                                 "An email has been sent to you with further instructions."
@@ -106,7 +109,7 @@ class CustomTokenCreateView(TokenCreateView):
                         status=status.HTTP_403_FORBIDDEN,
                     )
             else:
-                logger.error(f"Login failed for non-existent user: {email}")
+                logger.error("Login failed for non-existent user: {}", email)
             return Response(
                 {"error": "Invalid credentials. Please try again."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -152,6 +155,9 @@ class CustomTokenRefreshView(TokenRefreshView):
 
 class OTPVerifyView(APIView):
     permission_classes = [permissions.AllowAny]
+    # OTPs are short, so guesses are capped per client before any lookup is done.
+    throttle_classes = [AnonRateThrottle, ScopedRateThrottle]
+    throttle_scope = "otp_verify"
 
     def post(self, request):
         otp = request.data.get("otp")
@@ -161,8 +167,8 @@ class OTPVerifyView(APIView):
                 {"error": "OTP is required"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        user = User.objects.filter(
-            otp=otp, otp_expiry_time__gt=timezone.now()).first()
+        user_id = cache.get(otp_cache_key(otp))
+        user = User.objects.filter(pk=user_id).first() if user_id else None
 
         if not user:
             return Response(
@@ -175,12 +181,18 @@ class OTPVerifyView(APIView):
                 {
                     "error": f"Account is locked due to multiple failed login attempts. "
                     f"Please try again after "
-                    f"{settings.LOCKOUT_DURATION.total_seconds() / 60} minutes "
+                    f"{LOCKOUT_MIN} minutes "
                 },
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        user.verify_otp(otp)
+        # Tokens are only minted once the OTP has actually been consumed; a
+        # concurrent request that used the same code first gets an error instead.
+        if not user.verify_otp(otp):
+            return Response(
+                {"error": "Invalid or expired OTP"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         refresh = RefreshToken.for_user(user)
         access_token = str(refresh.access_token)
@@ -194,16 +206,18 @@ class OTPVerifyView(APIView):
             status=status.HTTP_200_OK,
         )
         set_auth_cookies(response, access_token, refresh_token)
-        logger.info(f"Successful login with OTP: {user.email}")
+        logger.info("Successful login with OTP: {}", user.email)
         return response
 
 
 class LogoutAPIView(APIView):
     def post(self, request: Request, *args: Any, **kwargs: Any):
         response = Response(status=status.HTTP_204_NO_CONTENT)
-        response.delete_cookie("access")
-        response.delete_cookie("refresh")
-        response.delete_cookie("logged_in")
+        # Use the same path and SameSite values the cookies were set with, so
+        # the browser actually replaces them.
+        for name in ("access", "refresh", "logged_in"):
+            response.delete_cookie(
+                name, path=settings.COOKIE_PATH, samesite=settings.COOKIE_SAMESITE)
 
-        logger.info(f"User {request.user.email} logged out successfully.")
+        logger.info("User {} logged out successfully.", request.user.email)
         return response
@@ -4,6 +4,8 @@ set -o errexit
 set -o nounset
 set -o pipefail
 
+export DJANGO_PROCESS_ROLE=worker
+
 python manage.py migrate django_celery_beat
 
 rm -f './celerybeat.pid'
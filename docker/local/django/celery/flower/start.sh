@@ -3,6 +3,8 @@
 set -o errexit
 set -o nounset
 
+export DJANGO_PROCESS_ROLE=worker
+
 exec watchfiles --filter python celery.__main__.main \
     --args \
     "-A  bankStream.celery_app -b \"${CELERY_BROKER_URL}\" flower --basic_auth=\"${CELERY_FLOWER_USER}:${CELERY_FLOWER_PASSWORD}\""
\ No newline at end of file
@@ -3,4 +3,6 @@
 set -o errexit
 set -o nounset
 
+export DJANGO_PROCESS_ROLE=worker
+
 exec watchfiles --filter python celery.__main__.main --args '-A  bankStream.celery_app worker -l INFO'
\ No newline at end of file